@@ -1,5 +1,6 @@
 import numpy as np
 from rlcard.envs.env import Env
+from rlcard.games.scopone.encoder import encode_state
 from rlcard.games.scopone.game import ScoponeGame
 
 
@@ -13,6 +14,9 @@ class ScoponeEnv(Env):
         self.actions = list(range(self.game.get_action_num()))
         # + 2 because of table and hand, plus captured cards and played cards per each player
         self.state_shape = [2 * self.game.get_player_num() + 2, self.game.get_action_num()]
+        # reusable scratch holding the masks of one observation (one per row),
+        # handed to the compiled encoder which decodes them all in one call
+        self._mask_buf = np.empty(self.state_shape[0], dtype=np.int64)
 
     def _load_model(self):
         pass
@@ -21,38 +25,28 @@ class ScoponeEnv(Env):
         """Extract the state representation for the agent which is now required to choose an action (the one
         corresponding to the current player)
 
-        :param state: game state and each of the players' state
+        :param state: game state and each of the players' state, with the card
+            collections encoded as 40-bit masks
         :type state: dict
         :return: the extracted state
         :rtype: dict
         """
         extracted_state = {}
         player_id = state["current_player"]
-        player_hand = state[f"player_{player_id}"]["hand"]
-        available_card_idx = [card.index for card in player_hand]
-        extracted_state["legal_actions"] = available_card_idx
-
-        allowed_actions_vec = np.zeros(self.game.get_action_num(), dtype=int)
-        allowed_actions_vec[available_card_idx] = 1
-        cards_on_table_idx = [card.index for card in state["table"]]
-        cards_on_table_vec = np.zeros(self.game.get_action_num(), dtype=int)
-        cards_on_table_vec[cards_on_table_idx] = 1
-
-        captured_cards_vec = np.zeros((self.game.get_player_num(), self.game.get_action_num()), dtype=int)
-        played_cards_vec = np.zeros((self.game.get_player_num(), self.game.get_action_num()), dtype=int)
-        for player_id in range(self.game.get_player_num()):
-            captured_cards = state[f"player_{player_id}"]["captured"]
-            captured_cards_idx = [c.index for c in captured_cards]
-            captured_cards_vec[player_id, captured_cards_idx] = 1
-            played_cards = state[f"player_{player_id}"]["played"]
-            played_cards_idx = [c.index for c in played_cards]
-            played_cards_vec[player_id, played_cards_idx] = 1
-
-        extracted_state["obs"] = np.concatenate((allowed_actions_vec.reshape(1, 40),
-                                                 cards_on_table_vec.reshape(1, 40),
-                                                 captured_cards_vec,
-                                                 played_cards_vec),
-                                                axis=0)
+        hand_mask = state[f"player_{player_id}"]["hand"]
+        extracted_state["legal_actions"] = [index for index in range(self.game.get_action_num())
+                                            if (hand_mask >> index) & 1]
+
+        player_num = self.game.get_player_num()
+        mask_buf = self._mask_buf
+        mask_buf[0] = hand_mask
+        mask_buf[1] = state["table"]
+        for player_id in range(player_num):
+            mask_buf[2 + player_id] = state[f"player_{player_id}"]["captured"]
+            mask_buf[2 + player_num + player_id] = state[f"player_{player_id}"]["played"]
+        obs = np.empty(self.state_shape, dtype=np.uint8)
+        encode_state(mask_buf, obs)
+        extracted_state["obs"] = obs
 
         return extracted_state
 
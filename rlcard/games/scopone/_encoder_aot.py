@@ -0,0 +1,29 @@
+"""Ahead-of-time build of the scopone state encoder.
+
+Compiles rlcard.games.scopone.encoder._encode_state into a prebuilt
+`scopone_encoder` extension living next to this file. Worker processes then
+import the extension instead of JIT-compiling the encoder on first use,
+which removes the per-worker warm-up. Build it with:
+
+    python rlcard/games/scopone/_encoder_aot.py
+
+or through setup.py, which picks up the extension when numba is installed.
+"""
+import importlib.util
+import os
+
+from numba.pycc import CC
+
+# Load encoder.py by file path: this module is also executed at build time,
+# where importing the full rlcard package (and its dependencies) is unwanted.
+_here = os.path.dirname(os.path.abspath(__file__))
+_spec = importlib.util.spec_from_file_location("_scopone_encoder_src", os.path.join(_here, "encoder.py"))
+_encoder_src = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_encoder_src)
+
+cc = CC("scopone_encoder")
+cc.output_dir = _here  # ship the extension inside the package
+cc.export("encode_state", "void(i8[:], u1[:, :])")(_encoder_src._encode_state)
+
+if __name__ == "__main__":
+    cc.compile()
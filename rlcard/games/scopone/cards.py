@@ -0,0 +1,9 @@
+SUITS = ["S", "H", "D", "C"]
+VALUES = ["A", "2", "3", "4", "5", "6", "7", "J", "Q", "K"]
+
+# All 40 card ids in index order, built once at import: the position of a card
+# in CARDS is its integer id, which is also its bit position in the mask
+# encoding used by the game. Game code converts card strings to integers at
+# deck build and works with integers from there on.
+CARDS = tuple(suit + printed for suit in SUITS for printed in VALUES)
+CARD_ID = {card: index for index, card in enumerate(CARDS)}
@@ -1,5 +1,7 @@
 import random
 
+from rlcard.games.scopone.cards import SUITS, VALUES
+
 
 class Card:
     def __init__(self, value, suit, card_id, index):
@@ -38,8 +40,8 @@ class Card:
 
 
 class Deck:
-    SUITS = ["S", "H", "D", "C"]
-    VALUES = ["A", "2", "3", "4", "5", "6", "7", "J", "Q", "K"]
+    SUITS = SUITS
+    VALUES = VALUES
 
     def __init__(self):
         self.cards = self._create_cards()
@@ -0,0 +1,39 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _encode_state(masks, out):
+    """Decode a vector of 40-bit card masks into a binary observation matrix.
+
+    :param masks: one card mask per observation row
+    :type masks: numpy.ndarray(int64)
+    :param out: output matrix of shape (len(masks), 40), written in place
+    :type out: numpy.ndarray(uint8)
+    """
+    for row in range(masks.shape[0]):
+        mask = masks[row]
+        for index in range(out.shape[1]):
+            out[row, index] = (mask >> index) & 1
+
+
+def _encode_state_numpy(masks, out):
+    """Vectorized numpy decode with the same signature as _encode_state,
+    used when neither the prebuilt extension nor numba is available."""
+    packed = masks.astype("<u8").view(np.uint8).reshape(masks.shape[0], 8)[:, :5]
+    out[:] = np.unpackbits(packed, axis=1, bitorder="little")[:, :out.shape[1]]
+
+
+try:
+    # a prebuilt extension (see _encoder_aot.py) avoids any compilation at import
+    from rlcard.games.scopone.scopone_encoder import encode_state
+except ImportError:
+    if njit is not None:
+        # nopython mode turns the bit loop into machine code with no Python C-API
+        # calls; cache=True amortizes the compilation across worker processes
+        encode_state = njit(cache=True)(_encode_state)
+    else:
+        encode_state = _encode_state_numpy
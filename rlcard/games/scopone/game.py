@@ -1,6 +1,15 @@
+from rlcard.games.scopone.cards import CARD_ID, VALUES
 from rlcard.games.scopone.deck import Deck
 from rlcard.games.scopone.player import ScoponePlayer
 
+# Masks used when scoring: the settebello and the ten diamond cards
+SETTEBELLO_MASK = 1 << CARD_ID["D7"]
+DIAMONDS_MASK = sum(1 << CARD_ID["D" + printed] for printed in VALUES)
+
+
+def count_bits(mask):
+    return bin(mask).count("1")
+
 
 class ScoponeGame:
     player_starting = 0
@@ -11,6 +20,7 @@ class ScoponeGame:
         self.completed_rounds = None
         self.current_player_id = None
         self.table = None
+        self.table_mask = None
         self.players = None
         self.deck = Deck()
         self.last_player_capturing_id = None
@@ -31,6 +41,7 @@ class ScoponeGame:
         self.player_starting = (self.player_starting + 1) % self.num_players
         self.completed_rounds = 0
         self.table = set()
+        self.table_mask = 0
         self.players = [ScoponePlayer(i) for i in range(self.num_players)]
         for player, cards in zip(self.players, self.deck.distribute_cards()):
             player.give_cards(cards)
@@ -41,7 +52,7 @@ class ScoponeGame:
         if player_id is None:
             player_id = self.current_player_id
         state = {}
-        state["table"] = self.table
+        state["table"] = self.table_mask
         state["current_player"] = player_id
         state["completed_rounds"] = self.completed_rounds
         for idx in range(self.num_players):
@@ -49,8 +60,8 @@ class ScoponeGame:
         return state
 
     def get_legal_actions(self):
-        current_player_hand = self.players[self.current_player_id].hand
-        return [card.index for card in current_player_hand]
+        hand_mask = self.players[self.current_player_id].hand_mask
+        return [index for index in range(40) if (hand_mask >> index) & 1]
 
     def is_over(self):
         last_round_is_over = (self.completed_rounds == self.num_rounds)
@@ -58,10 +69,10 @@ class ScoponeGame:
         return last_round_is_over and last_player_has_played
 
     def get_payoffs(self):
-        captured_0_2 = self.players[0].captured.union(self.players[2].captured)
+        captured_0_2 = self.players[0].captured_mask | self.players[2].captured_mask
         scope_0_2 = self.players[0].scope + self.players[2].scope
 
-        captured_1_3 = self.players[1].captured.union(self.players[3].captured)
+        captured_1_3 = self.players[1].captured_mask | self.players[3].captured_mask
         scope_1_3 = self.players[1].scope + self.players[3].scope
 
         score_team_0, score_team_1 = self._compute_payoff(captured_0_2, scope_0_2, captured_1_3, scope_1_3)
@@ -81,39 +92,38 @@ class ScoponeGame:
 
         player = self.players[self.current_player_id]
         card = action
+        card_bit = 1 << card.index
 
-        if card not in player.hand:
+        if not player.hand_mask & card_bit:
             raise ValueError("Action not allowed because the card is not in the player's hand")
 
-        player.hand.remove(card)
-        player.played.add(card)
-        # print(f"Player {self.current_player_id} with hand {[c.id for c in player.hand]} played the card {card.id}")
+        player.hand_mask &= ~card_bit
+        player.played_mask |= card_bit
         best_combination_on_the_table = self._get_best_combination(card)
         if best_combination_on_the_table:
             self.last_player_capturing_id = self.current_player_id
-            player.captured.add(card)
+            player.captured_mask |= card_bit
             for c in best_combination_on_the_table:
                 self.table.remove(c)
-                player.captured.add(c)
+                self.table_mask &= ~(1 << c.index)
+                player.captured_mask |= 1 << c.index
                 if not self.table and not (self._is_last_round and self._is_round_over()):
                     player.scope += 1
         else:
             self.table.add(card)
-        # print(f"Cards on the table after play: {[c.id  for c in self.table]}")
+            self.table_mask |= card_bit
 
         if self._is_round_over():
             self.completed_rounds += 1
-            # print(f"=========== Round {self.current_round} completed ============")
         self.current_player_id = (self.current_player_id + 1) % self.num_players
 
         if self.is_over():
             last_player_capturing = self.players[self.last_player_capturing_id]
-            # print(f"Giving the remaining cards to player {last_player_capturing.player_id}")
-            for card in self.table:
-                last_player_capturing.captured.add(card)
-                self.table = set()
-            assert all([len(p.played) == 10 for p in self.players])
-            assert all([len(p.hand) == 0 for p in self.players])
+            last_player_capturing.captured_mask |= self.table_mask
+            self.table = set()
+            self.table_mask = 0
+            assert all([count_bits(p.played_mask) == 10 for p in self.players])
+            assert all([p.hand_mask == 0 for p in self.players])
         return self.get_state(), self.current_player_id
 
     def _is_last_round(self):
@@ -122,6 +132,9 @@ class ScoponeGame:
     def _is_round_over(self):
         return self.current_player_id == (self.first_player_this_game + self.num_players - 1) % self.num_players
 
+    def _cards_in_mask(self, mask):
+        return [self.deck.get_card(index) for index in range(40) if (mask >> index) & 1]
+
     # TODO: make this more rigorous - e.g, then give priority to 6, 5, ...
     def _get_best_combination(self, played_card):
         compatible_combinations = self._get_compatible_combinations(played_card)
@@ -178,28 +191,28 @@ class ScoponeGame:
                     result.append([c] + combination)
             return result
 
-    def _compute_payoff(self, captured_0, scope_0, captured_1, scope_1):
+    def _compute_payoff(self, captured_mask_0, scope_0, captured_mask_1, scope_1):
         count_0 = scope_0
         count_1 = scope_1
 
         # settebello
-        if any([c.value == 7 and c.suit == "D" for c in captured_0]):
-            assert all([c.value != 7 or c.suit != "D" for c in captured_1])
+        if captured_mask_0 & SETTEBELLO_MASK:
+            assert not captured_mask_1 & SETTEBELLO_MASK
             count_0 += 1
         else:
-            assert any([c.value == 7 and c.suit == "D" for c in captured_1])
+            assert captured_mask_1 & SETTEBELLO_MASK
             count_1 += 1
 
         # carte
-        assert len(captured_0) + len(captured_1) == 40
-        if len(captured_0) > 20:
+        assert count_bits(captured_mask_0) + count_bits(captured_mask_1) == 40
+        if count_bits(captured_mask_0) > 20:
             count_0 += 1
-        elif len(captured_1) > 20:
+        elif count_bits(captured_mask_1) > 20:
             count_1 += 1
 
         # ori
-        diamonds_count_0 = len([c for c in captured_0 if c.suit == "D"])
-        diamonds_count_1 = len([c for c in captured_1 if c.suit == "D"])
+        diamonds_count_0 = count_bits(captured_mask_0 & DIAMONDS_MASK)
+        diamonds_count_1 = count_bits(captured_mask_1 & DIAMONDS_MASK)
         assert diamonds_count_0 + diamonds_count_1 == 10
         if diamonds_count_0 > 5:
             count_0 += 1
@@ -207,6 +220,8 @@ class ScoponeGame:
             count_1 += 1
 
         # primiera
+        captured_0 = self._cards_in_mask(captured_mask_0)
+        captured_1 = self._cards_in_mask(captured_mask_1)
         primiera_sum_0 = 0
         primiera_sum_1 = 0
         for suit in Deck.SUITS:
@@ -237,6 +252,3 @@ if __name__ == "__main__":
 
     print("Best combination:")
     print([c.id for c in game._get_best_combination(played_card)])
-
-
-
@@ -1,28 +1,26 @@
-
 class ScoponePlayer:
     def __init__(self, player_id):
         self.player_id = player_id
-        self.hand = set()
-        self.captured = set()
-        self.played = set()
+        self.hand_mask = 0
+        self.captured_mask = 0
+        self.played_mask = 0
         self.scope = 0
 
     def get_state(self):
         """Encode the state for the player in a dictionary
-        :param table: cards on the table
-        :type table: List[String]
-        :param legal_actions: cards that are still in the hand of the player and which can be played
-        :type legal_actions: List[int]
-        :return: the encoded state of the player
-        :rtype: dict(string: List[Int])
+
+        :return: the encoded state of the player, with the card collections
+            encoded as 40-bit masks (bit i set means the card with index i
+            belongs to the collection)
+        :rtype: dict(string: int)
         """
         state = {}
-        state["hand"] = self.hand
-        state["captured"] = self.captured
-        state["played"] = self.played
+        state["hand"] = self.hand_mask
+        state["captured"] = self.captured_mask
+        state["played"] = self.played_mask
         state["scope"] = self.scope
         return state
 
     def give_cards(self, cards):
         for card in cards:
-            self.hand.add(card)
+            self.hand_mask |= 1 << card.index
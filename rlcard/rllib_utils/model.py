@@ -51,12 +51,24 @@ class ParametricActionsModel(TFModelV2):
         obs_concat = input_dict["obs"]["real_obs"]
         if isinstance(obs_concat, list):
             obs_concat = tf.concat(values=flatten_list(obs_concat), axis=1)
-        action_embed, _ = self.action_embed_model({"obs": obs_concat})
+        # observations travel as uint8; the network wants floats
+        action_embed, _ = self.action_embed_model({"obs": tf.cast(obs_concat, tf.float32)})
 
         # Mask out invalid actions (use tf.float32.min for stability)
-        action_mask = input_dict["obs"]["action_mask"]
+        action_mask = tf.cast(input_dict["obs"]["action_mask"], tf.float32)
         inf_mask = tf.maximum(tf.math.log(action_mask), tf.float32.min)
         return action_embed + inf_mask, state
 
     def value_function(self):
         return self.action_embed_model.value_function()
+
+
+class CompiledParametricActionsModel(ParametricActionsModel):
+    """ ParametricActionsModel whose forward pass is compiled with tf.function.
+
+    Tracing the forward pass into a graph removes the per-call Python overhead,
+    which adds up because the model is evaluated once per sampled env step.
+    """
+    def __init__(self, *args, **kwargs):
+        super(CompiledParametricActionsModel, self).__init__(*args, **kwargs)
+        self.forward = tf.function(self.forward)
@@ -18,13 +18,16 @@ class RLCardWrapper(MultiAgentEnv):
         # create the rlcard environment
         self.rlcard_env = rlcard.make(env_config['rlcard_env_id'])
 
-        # state and action spaces
+        # state and action spaces. Observations are binary (one-hot card
+        # vectors), so uint8 is declared end-to-end: sample batches move as
+        # one byte per entry instead of a float32, and the model casts to
+        # float right before the network.
         self.action_space = Discrete(self.rlcard_env.action_num)  # number of actions in this game
         self.observation_space = Dict({
-            "real_obs": Box(low=-float('inf'), high=float('inf'), shape=self.rlcard_env.state_shape),
+            "real_obs": Box(low=0, high=1, shape=self.rlcard_env.state_shape, dtype=np.uint8),
 
             # we have to handle changing action spaces
-            "action_mask": Box(0, 1, shape=(self.rlcard_env.action_num,)),
+            "action_mask": Box(0, 1, shape=(self.rlcard_env.action_num,), dtype=np.uint8),
         })
 
         # these players will have to be randomized for evaluation purposes
@@ -84,7 +87,7 @@ class RLCardWrapper(MultiAgentEnv):
         return obs, reward, done, {}
 
     def get_state(self, rlcard_state):
-        mask = np.zeros(self.action_space.n)
+        mask = np.zeros(self.action_space.n, dtype=np.uint8)
         mask[rlcard_state['legal_actions']] = 1
         return {
             'real_obs': rlcard_state['obs'],
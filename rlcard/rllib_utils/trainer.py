@@ -2,6 +2,7 @@ import ray
 from ray import tune
 from ray.rllib.agents.a3c import A2CTrainer
 from ray.rllib.agents.a3c.a3c_tf_policy import A3CTFPolicy
+from ray.rllib.agents.impala import ImpalaTrainer
 from ray.rllib.agents.ppo import PPOTrainer
 from ray.rllib.agents.dqn import DQNTrainer
 from ray.rllib.agents.ppo.ppo_tf_policy import PPOTFPolicy
@@ -12,10 +13,121 @@ from ray.tune.registry import register_env
 
 from rlcard.rllib_utils.custom_metrics import PlayerScoreCallbacks
 from rlcard.rllib_utils.random_policy import RandomPolicy
-from rlcard.rllib_utils.model import ParametricActionsModel
+from rlcard.rllib_utils.model import ParametricActionsModel, CompiledParametricActionsModel
 from rlcard.rllib_utils.rlcard_wrapper import RLCardWrapper
 
+import functools
+import os
+import sys
 import time
+import types
+
+# Cache of (observation_space, action_space) per env id: probing the spaces
+# requires constructing a full env, which we only want to pay once per process.
+_SPACE_CACHE = {}  # {rlcard_env_id: (observation_space, action_space)}
+
+
+def _make_rlcard_env(env_config):
+    """Top-level env factory, so Ray can pickle it without capturing a trainer instance"""
+    return RLCardWrapper(env_config)
+
+
+def _policy_mapping(agent_to_policy, agent_id):
+    """Top-level mapping function: bound to the agent dict with functools.partial,
+    it pickles as the function name plus the small dict, unlike a lambda closing
+    over the trainer which would make cloudpickle ship the whole RLTrainer object
+    to every rollout worker.
+    """
+    return agent_to_policy[agent_id]
+
+
+# Policies RLTrainer knows how to configure, frozen once so validation reuses
+# the same hash table on every construction.
+_SUPPORTED_POLICIES = frozenset({PPOTFPolicy, DQNTFPolicy, A3CTFPolicy, RandomPolicy})
+
+
+# Trainer config keys shared by every trainer class, frozen once at import
+# time so tune sweeps that instantiate many trials reuse the same mapping
+# instead of rebuilding it per construction.
+_BASE_TRAINER_CONFIG = types.MappingProxyType({
+    "timesteps_per_iteration": 20000,
+    # "min_iter_time_s": 30,
+
+    "evaluation_num_workers": 0,
+    # Enable evaluation, once per training iteration.
+    "evaluation_interval": 1,
+    # Run 10 episodes each time evaluation runs.
+    "evaluation_num_episodes": 500,
+    "callbacks": PlayerScoreCallbacks,
+
+    # Keep sample batches as plain contiguous numpy arrays so Ray can pass
+    # them through the Plasma store by reference instead of compressing and
+    # copying them between rollout workers and the learner.
+    "compress_observations": False,
+    "output_compress_columns": [],
+    "observation_filter": "NoFilter",
+    "num_cpus_per_worker": 1,
+
+    # Step envs in batches inside every rollout worker: one policy inference
+    # call serves 16 envs, amortizing the Python/TF boundary crossing that
+    # dominates when stepping a single env at a time.
+    "num_envs_per_worker": 16,
+    "batch_mode": "truncate_episodes",
+    "rollout_fragment_length": 200,
+})
+
+# PPO batch sizing: decouple the effective batch from the per-step minibatch.
+# Each sampled batch of 4096 steps is consumed in minibatches of 256 over 10
+# SGD passes, so the local batch stays small while the effective batch is
+# large enough for stable convergence.
+_PPO_BATCH_CONFIG = types.MappingProxyType({
+    "train_batch_size": 4096,
+    "sgd_minibatch_size": 256,
+    "num_sgd_iter": 10,
+})
+
+def _colocated_config(resources):
+    """Config keys for colocating rollout workers with the learner's GPU(s).
+
+    Each worker gets a 0.1 GPU slice so it is scheduled onto the learner's
+    device and weight broadcasts stay on-host. The GPU count comes from
+    resources, matching what __init__ hands to ray.init: hardcoding a GPU
+    here would make tune wait forever on a cluster that has none.
+    """
+    num_gpus = resources.get('num_gpus', 0)
+    return {
+        "num_gpus": num_gpus,
+        "num_gpus_per_worker": 0.1 if num_gpus else 0,
+    }
+
+
+# Rollout/learning overlap: sample asynchronously on as many workers as the
+# host allows, each stepping a batch of envs in a remote process, so env
+# simulation overlaps the learner's forward/backward passes instead of
+# alternating with them.
+_ASYNC_ROLLOUT_CONFIG = types.MappingProxyType({
+    "sample_async": True,
+    "num_workers": max(2, (os.cpu_count() or 2) - 1),
+    "remote_worker_envs": True,
+    "remote_env_batch_wait_ms": 0,
+})
+
+# DQN-specific companions to the async rollout path: prioritized replay and a
+# warm-up period before learning starts.
+_DQN_ASYNC_ROLLOUT_CONFIG = types.MappingProxyType({
+    "prioritized_replay": True,
+    "learning_starts": 1000,
+})
+
+# Sampling keys used in async mode (IMPALA): rollout workers keep sample
+# requests in flight and pull weights lazily instead of stepping behind the
+# global barrier of the synchronous trainers.
+_ASYNC_SAMPLING_CONFIG = types.MappingProxyType({
+    "num_workers": 2,
+    "sample_async": True,
+    "max_sample_requests_in_flight_per_worker": 2,
+    "broadcast_interval": 1,
+})
 
 
 class RLTrainer:
@@ -38,6 +150,24 @@ class RLTrainer:
             agents in order to evaluate how well the other agents play vs random agents.
         experiment_name (str): Name of the experiment. If None, rlcard_env_id is used as name.
         resources (dict): resource to be used by rllib.
+        plasma_gb (int): size in GB of Ray's Plasma object store. Sample batches flow between
+            rollout workers and the learner through Plasma, and the default sizing can spill
+            to disk on long runs. If None, the RAY_OBJ_STORE_GB environment variable is used
+            (default 4).
+        mode (str): 'sync' (default) trains with the synchronous trainer mapped to each
+            policy. 'async' trains PPO policies with IMPALA instead, so rollout and
+            learning are decoupled and workers do not wait on a global barrier.
+        compile_model (bool): if True (default), the custom model's forward pass is
+            compiled with tf.function, removing per-call Python overhead from the
+            rollout inference path.
+        async_rollouts (bool): if True, sampling runs asynchronously on multiple
+            workers with batched remote envs, overlapping env simulation with the
+            learner's SGD instead of alternating between them. DQN trainers also get
+            prioritized replay and a learning warm-up.
+        colocate (bool): if True, rollout workers share the learner's GPU(s) (a 0.1
+            slice each), keeping inference and weight broadcasts on the same device.
+            The GPU count is taken from resources ('num_gpus'); without GPUs this is
+            a no-op.
     """
 
     POLICY_TO_TRAINER = {
@@ -47,8 +177,10 @@ class RLTrainer:
         RandomPolicy: None
     }
 
+    # The policy configs are frozen templates shared by all instances; they are
+    # merged into fresh per-trainer dicts in collect_trainers_config.
     POLICY_TO_CONFIG = {
-        PPOTFPolicy: {
+        PPOTFPolicy: types.MappingProxyType({
             # "env": rlcard_env_id,
             "model": {
                 "custom_model": "parametric_model_tf",
@@ -57,8 +189,8 @@ class RLTrainer:
             # disable filters, otherwise we would need to synchronize those
             # as well to the DQN agent
             # "observation_filter": "NoFilter",
-        },
-        DQNTFPolicy: {
+        }),
+        DQNTFPolicy: types.MappingProxyType({
             "model": {
                 "custom_model": "parametric_model_tf",
                 # 'fcnet_hiddens': [256, 256, 256]
@@ -69,27 +201,31 @@ class RLTrainer:
             # defined a a custom DistributionalQModel that is aware of masking.
             'hiddens': [],
             "dueling": False,
-        },
-        A3CTFPolicy: {
+        }),
+        A3CTFPolicy: types.MappingProxyType({
             "model": {
                 "custom_model": "parametric_model_tf",
                 # 'fcnet_hiddens': [256, 256, 256]
             },
-        },
-        RandomPolicy: {}
+        }),
+        RandomPolicy: types.MappingProxyType({})
     }
 
-    def __init__(self, rlcard_env_id, agent_to_policy, policy_to_class, randomize_agents_eval=[], experiment_name=None, resources={}):
+    def __init__(self, rlcard_env_id, agent_to_policy, policy_to_class, randomize_agents_eval=[], experiment_name=None, resources={}, plasma_gb=None, mode='sync', compile_model=True, async_rollouts=False, colocate=False):
 
+        assert mode in ('sync', 'async'), "mode must be 'sync' or 'async', got '{}'.".format(mode)
+        self.mode = mode
+        self.async_rollouts = async_rollouts
+        self.colocate = colocate
         self.rlcard_env_id = rlcard_env_id
         self.agent_to_policy = agent_to_policy
         self.policy_to_class = policy_to_class
         self.randomize_agents_eval = randomize_agents_eval
         self.experiment_name = rlcard_env_id if experiment_name is None else experiment_name
+        self.plasma_gb = int(os.environ.get("RAY_OBJ_STORE_GB", "4")) if plasma_gb is None else plasma_gb
 
         # --- Assert input parameters are valid ---
-        all_policies = {v for _, v in policy_to_class.items()}
-        non_supported_policies = all_policies.difference(self.POLICY_TO_CONFIG.keys())
+        non_supported_policies = set(policy_to_class.values()) - _SUPPORTED_POLICIES
         assert len(non_supported_policies) == 0, 'The following policies are not supported: {}.'.format(
             non_supported_policies)
         assert all([v in policy_to_class for _, v in agent_to_policy.items()]),\
@@ -97,21 +233,45 @@ class RLTrainer:
 
         # --- Register env and model to be used by rllib ---
         # TODO: how to create a RLcard env with multiple agents? Seems by default is with 2
-        RLCardWrapped = lambda env_config: RLCardWrapper(env_config)
-        register_env(rlcard_env_id, RLCardWrapped)
-        ModelCatalog.register_custom_model("parametric_model_tf", ParametricActionsModel)
+        register_env(rlcard_env_id, _make_rlcard_env)
+        model_class = CompiledParametricActionsModel if compile_model else ParametricActionsModel
+        ModelCatalog.register_custom_model("parametric_model_tf", model_class)
 
         # --- Extract the configuration for the trainer(s) ---
-        env_tmp = RLCardWrapped({'rlcard_env_id': self.rlcard_env_id})
+        if rlcard_env_id not in _SPACE_CACHE:
+            env_tmp = _make_rlcard_env({'rlcard_env_id': rlcard_env_id})
+            _SPACE_CACHE[rlcard_env_id] = (env_tmp.observation_space, env_tmp.action_space)
+        observation_space, action_space = _SPACE_CACHE[rlcard_env_id]
         self.trainer_to_config = self.collect_trainers_config(
             policy_to_class=policy_to_class,
             agent_to_policy=agent_to_policy,
-            observation_space=env_tmp.observation_space,
-            action_space=env_tmp.action_space,
+            observation_space=observation_space,
+            action_space=action_space,
             randomize_agents_eval=randomize_agents_eval,
             resources=resources,
         )  # {trainer class: trainer config}
 
+        # --- Bring up Ray once and reuse it across train() calls ---
+        # tune.run would otherwise bootstrap a cluster on every call, paying
+        # the startup cost repeatedly during hyperparameter sweeps. The
+        # dashboard is skipped since nothing here uses it.
+        ray.init(
+            num_cpus=resources.get('num_cpus'),
+            num_gpus=resources.get('num_gpus', 0),
+            object_store_memory=self.plasma_gb * (1 << 30),
+            _plasma_directory="/dev/shm" if sys.platform.startswith("linux") else None,
+            include_dashboard=False,
+            log_to_driver=False,
+            ignore_reinit_error=True,
+        )
+
+        # --- Validate the batch sizing after user overrides are merged in ---
+        for trainer_class, trainer_config in self.trainer_to_config.items():
+            if 'sgd_minibatch_size' in trainer_config and 'train_batch_size' in trainer_config:
+                assert trainer_config['sgd_minibatch_size'] <= trainer_config['train_batch_size'],\
+                    'sgd_minibatch_size ({}) cannot be larger than train_batch_size ({}).'.format(
+                        trainer_config['sgd_minibatch_size'], trainer_config['train_batch_size'])
+
     def collect_trainers_config(
             self, policy_to_class, agent_to_policy, observation_space, action_space, randomize_agents_eval, resources):
         # 1. Collect the policy configs to be used by the trainer(s)
@@ -121,7 +281,9 @@ class RLTrainer:
                 policy_class,
                 observation_space,
                 action_space,
-                self.POLICY_TO_CONFIG[policy_class]
+                # copy the frozen template into a plain dict: the config handed
+                # to tune.run must stay deep-copyable/picklable
+                dict(self.POLICY_TO_CONFIG[policy_class])
             )
 
         # 2. Collect for every trainer the polices it should train
@@ -129,15 +291,21 @@ class RLTrainer:
         for _, policy_name in agent_to_policy.items():
             policy_class = policy_to_class[policy_name]
             trainer_class = self.POLICY_TO_TRAINER[policy_class]
+            if self.mode == 'async' and trainer_class is PPOTrainer:
+                # asynchronous updates go through IMPALA instead of the synchronous PPO path
+                trainer_class = ImpalaTrainer
             if trainer_class is not None:  # RandomPolicy is not to be trained and has trainer None
                 if trainer_class not in policies_to_train:
                     policies_to_train[trainer_class] = set()
                 policies_to_train[trainer_class].add(policy_name)
 
-        # 3. Finally collect all the trainers config
+        # 3. Finally collect all the trainers config, merging the frozen base
+        # template, the per-trainer keys and the user resources in one expression
         trainer_to_config = {}  # {trainer class: trainer config}
         for trainer_class, policies_to_train_ in policies_to_train.items():
             trainer_to_config[trainer_class] = {
+                **_BASE_TRAINER_CONFIG,
+
                 "env": self.rlcard_env_id,
                 "env_config": {
                     'rlcard_env_id': self.rlcard_env_id,
@@ -146,17 +314,11 @@ class RLTrainer:
                 "multiagent": {
                     "policies_to_train": policies_to_train_,
                     "policies": policies,
-                    "policy_mapping_fn": lambda agent_id: self.agent_to_policy[agent_id],
+                    # ship the mapping by value: remote workers re-import this
+                    # module and would not see any state set by the driver
+                    "policy_mapping_fn": functools.partial(_policy_mapping, dict(agent_to_policy)),
                 },
 
-                "timesteps_per_iteration": 20000,
-                # "min_iter_time_s": 30,
-
-                "evaluation_num_workers": 0,
-                # Enable evaluation, once per training iteration.
-                "evaluation_interval": 1,
-                # Run 10 episodes each time evaluation runs.
-                "evaluation_num_episodes": 500,
                 # Override the env config for evaluation.
                 "evaluation_config": {
                     "env_config": {
@@ -164,9 +326,14 @@ class RLTrainer:
                         "randomize_agents_eval": randomize_agents_eval,
                     },
                 },
-                "callbacks": PlayerScoreCallbacks
+
+                **(_PPO_BATCH_CONFIG if trainer_class is PPOTrainer else {}),
+                **(_ASYNC_SAMPLING_CONFIG if trainer_class is ImpalaTrainer else {}),
+                **(_ASYNC_ROLLOUT_CONFIG if self.async_rollouts else {}),
+                **(_DQN_ASYNC_ROLLOUT_CONFIG if self.async_rollouts and trainer_class is DQNTrainer else {}),
+                **(_colocated_config(resources) if self.colocate else {}),
+                **resources,
             }
-            trainer_to_config[trainer_class].update(resources)
         return trainer_to_config
 
     def train(self, stop=None, restore=None):
@@ -214,8 +381,11 @@ class RLTrainer:
             #     policy_rewards = sorted(['{}: {}'.format(k, v) for k, v in res['policy_reward_mean'].items()])
             #     print("Iteration {}. policy_reward_mean: {}".format(i, policy_rewards))
         else:
-            # If there is only one trainer then we use tune
-            trainer_class, trainer_config = self.trainer_to_config.popitem()
+            # If there is only one trainer then we use tune. Extract it without
+            # mutating trainer_to_config, so train() can be called again on the
+            # same instance (e.g. across a hyperparameter study) without paying
+            # __init__'s env probing a second time.
+            trainer_class, trainer_config = next(iter(self.trainer_to_config.items()))
 
             # # --------
             # ray.init(num_cpus=4, num_gpus=1)
@@ -8,6 +8,24 @@ extras = {
     'tensorflow': ['tensorflow>=1.14,<2.0', 'tensorflow_probability==0.7.0']
 }
 
+# Compile the scopone state encoder ahead of time when numba is available at
+# build time, so worker processes import a prebuilt extension instead of
+# JIT-compiling on first use. Skipped silently otherwise.
+ext_modules = []
+try:
+    import importlib.util
+    spec = importlib.util.spec_from_file_location(
+        '_encoder_aot', 'rlcard/games/scopone/_encoder_aot.py')
+    _encoder_aot = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(_encoder_aot)
+    ext = _encoder_aot.cc.distutils_extension()
+    # pycc names the extension after the CC module; qualify it so it installs
+    # inside the package, where encoder.py imports it from
+    ext.name = 'rlcard.games.scopone.scopone_encoder'
+    ext_modules.append(ext)
+except ImportError:
+    pass
+
 setuptools.setup(
     name="rlcard",
     version="0.1.15",
@@ -35,6 +53,7 @@ setuptools.setup(
         'matplotlib>=3.0',
         'termcolor',
     ],
+    ext_modules=ext_modules,
     extras_require=extras,
     requires_python='>=3.5',
     classifiers=[
@@ -0,0 +1,61 @@
+import unittest
+import numpy as np
+
+import rlcard
+from rlcard.agents.random_agent import RandomAgent
+from rlcard.games.scopone.encoder import _encode_state, _encode_state_numpy, encode_state
+
+
+class TestScoponeEnv(unittest.TestCase):
+
+    def test_init_game_and_extract_state(self):
+        env = rlcard.make('scopone')
+        state, _ = env.init_game()
+        self.assertEqual(state['obs'].shape, (10, 40))
+        self.assertEqual(state['obs'].dtype, np.uint8)
+        self.assertEqual(state['obs'][0].sum(), 10)  # current player's hand
+        self.assertEqual(state['obs'][1].sum(), 0)  # the table starts empty
+
+    def test_get_legal_actions(self):
+        env = rlcard.make('scopone')
+        env.init_game()
+        legal_actions = env._get_legal_actions()
+        self.assertEqual(legal_actions, sorted(legal_actions))
+        for legal_action in legal_actions:
+            self.assertLess(legal_action, 40)
+
+    def test_step(self):
+        env = rlcard.make('scopone')
+        state, player_id = env.init_game()
+        action = np.random.choice(state['legal_actions'])
+        next_state, next_player_id = env.step(action)
+        self.assertEqual(next_player_id, (player_id + 1) % 4)
+        self.assertEqual(next_state['obs'].shape, (10, 40))
+        self.assertEqual(next_state['obs'].dtype, np.uint8)
+
+    def test_run(self):
+        env = rlcard.make('scopone')
+        env.set_agents([RandomAgent(env.action_num) for _ in range(env.player_num)])
+        _, payoffs = env.run(is_training=False)
+        total = 0
+        for payoff in payoffs:
+            total += payoff
+        self.assertEqual(total, 0)
+
+    def test_encoder_parity(self):
+        # the dispatched encoder (AOT extension or njit when available) and
+        # both reference implementations must decode the same masks identically
+        masks = np.array([0, 1, (1 << 40) - 1, 0x5A5A5A5A5A, 1 << 39, 0x123456789],
+                         dtype=np.int64)
+        out_loop = np.empty((len(masks), 40), dtype=np.uint8)
+        _encode_state(masks, out_loop)
+        out_numpy = np.empty_like(out_loop)
+        _encode_state_numpy(masks, out_numpy)
+        np.testing.assert_array_equal(out_loop, out_numpy)
+        out_active = np.empty_like(out_loop)
+        encode_state(masks, out_active)
+        np.testing.assert_array_equal(out_loop, out_active)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from rlcard.games.scopone.game import ScoponeGame as Game, count_bits
+
+
+class TestScoponeGame(unittest.TestCase):
+
+    def test_get_player_num(self):
+        game = Game()
+        player_num = game.get_player_num()
+        self.assertEqual(player_num, 4)
+
+    def test_get_action_num(self):
+        game = Game()
+        action_num = game.get_action_num()
+        self.assertEqual(action_num, 40)
+
+    def test_init_game(self):
+        game = Game()
+        state, current_player = game.init_game()
+        self.assertEqual(game.completed_rounds, 0)
+        self.assertEqual(state["table"], 0)
+        for player in game.players:
+            self.assertEqual(count_bits(player.hand_mask), 10)
+            self.assertEqual(player.captured_mask, 0)
+            self.assertEqual(player.played_mask, 0)
+        self.assertEqual(state["current_player"], current_player)
+
+    def test_get_legal_actions(self):
+        game = Game()
+        game.init_game()
+        legal_actions = game.get_legal_actions()
+        self.assertEqual(len(legal_actions), 10)
+        hand_mask = game.players[game.current_player_id].hand_mask
+        for action in legal_actions:
+            self.assertTrue((hand_mask >> action) & 1)
+
+    def test_step(self):
+        game = Game()
+        game.init_game()
+        player = game.players[game.current_player_id]
+        action = game.get_legal_actions()[0]
+        card = game.deck.get_card(action)
+        state, next_player = game.step(card)
+        self.assertEqual(count_bits(player.hand_mask), 9)
+        self.assertTrue((player.played_mask >> action) & 1)
+        self.assertEqual(next_player, (player.player_id + 1) % 4)
+
+    def test_proceed_game(self):
+        game = Game()
+        game.init_game()
+        while not game.is_over():
+            action = game.get_legal_actions()[0]
+            game.step(game.deck.get_card(action))
+        payoffs = game.get_payoffs()
+        self.assertEqual(len(payoffs), 4)
+        self.assertEqual(payoffs[0], payoffs[2])
+        self.assertEqual(payoffs[0], -payoffs[1])
+        captured_all = 0
+        for player in game.players:
+            captured_all |= player.captured_mask
+        self.assertEqual(count_bits(captured_all), 40)
+
+
+if __name__ == '__main__':
+    unittest.main()